@@ -3,6 +3,31 @@ from enum import Enum
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pre-encoded pieces of the events broadcast when loads and switches change.
+# The level endings double as the replies to load level queries.
+_LOAD_EVENT_PREFIXES = tuple(f"^K{number:03d}".encode("ascii") for number in range(1000))
+_LOAD_LEVELS = tuple(f"{level:02d}\r".encode("ascii") for level in range(100))
+_SWITCH_PRESSED_EVENTS = tuple(f"P{number:03d}\r".encode("ascii") for number in range(1000))
+_SWITCH_RELEASED_EVENTS = tuple(f"R{number:03d}\r".encode("ascii") for number in range(1000))
+
+# Instant status is not emulated, so these are always the same.
+_LOAD_STATES_RESPONSE = b"000000000000000000000000000000000000000000000000\r"
+_SWITCH_STATES_RESPONSE = b"00000000000000000000000000000000000000 0000000000000000000000000000000000000000000000000000000000\r"
+
+# Fixed width ASCII number fields, parsed without slicing. Anything other
+# than digits is rejected rather than turned into an out of range number.
+def _digit(data: bytes, offset: int) -> int:
+    value = data[offset] - 48
+    if not 0 <= value <= 9:
+        raise ValueError(f"Expected a digit at {offset}, got {data[offset:offset + 1]!r}")
+    return value
+
+def _parse2(data: bytes, offset: int) -> int:
+    return _digit(data, offset) * 10 + _digit(data, offset + 1)
+
+def _parse3(data: bytes, offset: int) -> int:
+    return _digit(data, offset) * 100 + _digit(data, offset + 1) * 10 + _digit(data, offset + 2)
+
 class MockSystem(Enum):
     LITEJET = 1
     LITEJET_48 = 2
@@ -10,8 +35,10 @@ class MockSystem(Enum):
 class MockMCP:
     def __init__(self, system: MockSystem = MockSystem.LITEJET):
         self._system = system
-        self._load_levels = {}
-        self._switch_pressed = {}
+        # Indexed by load number, like the event tables.
+        self._load_levels = [0] * len(_LOAD_EVENT_PREFIXES)
+        self._switch_pressed = set()
+        self._name_responses = {}
         self._broadcast_receivers = []
         self._other = None
         self._prefix = ""
@@ -22,36 +49,40 @@ class MockMCP:
             self._other._prefix = "Bravo "
             self._other._other = self
 
-    def _broadcast(self, line: str):
-        b = line.encode("utf-8")
-        _LOGGER.info(f"bcst MCP: {b}")
+    def _broadcast(self, b: bytes):
+        _LOGGER.info("bcst MCP: %s", b)
         for r in self._broadcast_receivers:
             r(b)
 
-    def _broadcast_other(self, line: str):
-        if self._other:
-            self._other._broadcast(line)
-
     def add_listener(self, r):
         self._broadcast_receivers.append(r)
 
+    def remove_listener(self, r):
+        self._broadcast_receivers.remove(r)
+
     def set_load(self, number: int, level: int):
         self._load_levels[number] = level
-        self._broadcast(f"^K{number:03d}{level:02d}\r")
-        self._broadcast_other(f"^K{number+40:03d}{level:02d}\r")
+        level_bytes = _LOAD_LEVELS[level]
+        self._broadcast(_LOAD_EVENT_PREFIXES[number] + level_bytes)
+        if self._other:
+            # The other MCP numbers this board's loads after its own 40;
+            # those past 999 can't be written as an event.
+            other_number = number + 40
+            if other_number < len(_LOAD_EVENT_PREFIXES):
+                self._other._broadcast(_LOAD_EVENT_PREFIXES[other_number] + level_bytes)
 
     def set_switch(self, number: int, pressed: bool):
-        if self._switch_pressed.get(number, False) == pressed:
+        if (number in self._switch_pressed) == pressed:
             return
-        self._switch_pressed[number] = pressed
         if pressed:
-            event = "P"
+            self._switch_pressed.add(number)
+            self._broadcast(_SWITCH_PRESSED_EVENTS[number])
         else:
-            event = "R"
-        self._broadcast(f"{event}{number:03d}\r")
+            self._switch_pressed.discard(number)
+            self._broadcast(_SWITCH_RELEASED_EVENTS[number])
 
     def get_load(self, number: int):
-        return self._load_levels.get(number, 0)
+        return self._load_levels[number]
 
     def get_switch_name(self, number: int):
         return f"{self._prefix}Switch #{number}"
@@ -62,70 +93,102 @@ class MockMCP:
     def get_scene_name(self, number: int):
         return f"{self._prefix}Scene #{number}"
 
-    def handle_input(self, data: bytes):
-        _LOGGER.info(f"  to MCP: {data}")
-        str = data.decode("utf-8")
+    def _activate_load(self, data: bytes, start: int):
+        self.set_load(_parse3(data, start + 2), 99)
+
+    def _deactivate_load(self, data: bytes, start: int):
+        self.set_load(_parse3(data, start + 2), 0)
+
+    def _scene(self, data: bytes, start: int):
+        _LOGGER.warning("Scenes not supported")
+
+    def _activate_load_at(self, data: bytes, start: int):
+        # The rate digits are ignored; level changes are applied at once.
+        self.set_load(_parse3(data, start + 2), _parse2(data, start + 5))
+
+    def _load_level(self, data: bytes, start: int):
+        return _LOAD_LEVELS[self.get_load(_parse3(data, start + 2))]
+
+    def _load_states(self, data: bytes, start: int):
+        _LOGGER.warning("Instant status not supported")
+        return _LOAD_STATES_RESPONSE
+
+    def _switch_states(self, data: bytes, start: int):
+        _LOGGER.warning("Instant status not supported")
+        return _SWITCH_STATES_RESPONSE
+
+    def _press_switch(self, data: bytes, start: int):
+        self.set_switch(_parse3(data, start + 2), True)
+
+    def _release_switch(self, data: bytes, start: int):
+        self.set_switch(_parse3(data, start + 2), False)
+
+    def _name_response(self, get_name, number: int):
+        # Names never change, so each response is encoded once.
+        key = (get_name, number)
+        response = self._name_responses.get(key)
+        if response is None:
+            response = f"{get_name(number)}\r".encode("ascii")
+            self._name_responses[key] = response
+        return response
+
+    def _switch_name(self, data: bytes, start: int):
+        return self._name_response(self.get_switch_name, _parse3(data, start + 2))
+
+    def _load_name(self, data: bytes, start: int):
+        return self._name_response(self.get_load_name, _parse3(data, start + 2))
+
+    def _scene_name(self, data: bytes, start: int):
+        return self._name_response(self.get_scene_name, _parse3(data, start + 2))
+
+    # Command byte -> (command length, handler returning the response bytes).
+    _COMMANDS = {
+        ord("A"): (5, _activate_load),
+        ord("B"): (5, _deactivate_load),
+        ord("C"): (5, _scene),
+        ord("D"): (5, _scene),
+        ord("E"): (9, _activate_load_at),
+        ord("F"): (5, _load_level),
+        ord("G"): (2, _load_states),
+        ord("H"): (2, _switch_states),
+        ord("I"): (5, _press_switch),
+        ord("J"): (5, _release_switch),
+        ord("K"): (5, _switch_name),
+        ord("L"): (5, _load_name),
+        ord("M"): (5, _scene_name),
+    }
+
+    def handle_input(self, data: bytes, start: int = 0):
+        # Handles the command at data[start:] and returns how many bytes it used.
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("  to MCP: %s", data[start:])
 
         # Skip until a command start marker
-        start_index = 0
-        while start_index < len(str) and str[start_index] != "+":
-            start_index += 1
-        if start_index != 0:
-            _LOGGER.debug(f"Skipped {start_index} bytes")
-            return start_index, None
-
-        command = str[1]
-        response = None
+        start_index = data.find(b"+", start)
+        if start_index < 0:
+            start_index = len(data)
+        if start_index != start:
+            _LOGGER.debug("Skipped %d bytes", start_index - start)
+            return start_index - start, None
+
+        command = data[start + 1] if start + 1 < len(data) else 0
         mcp = self
-        if command.islower():
+        if 0x61 <= command <= 0x7A:
+            # Lower case commands are for the other MCP.
             if self._other:
                 mcp = self._other
-            command = command.upper()
-        if command in "ABCDEFIJKLM":
-            number = int(str[2:5])
-        if command == "A":
-            mcp.set_load(number, 99)
-            command_length = 5
-        elif command == "B":
-            mcp.set_load(number, 0)
-            command_length = 5
-        elif command == "C" or command == "D":
-            _LOGGER.warning("Scenes not supported")
-        elif command == "E":
-            level = int(str[5:7])
-            rate = int(str[7:9])
-            mcp.set_load(number, level)
-            command_length = 9
-        elif command == "F":
-            response = f"{mcp.get_load(number):02d}\r"
-            command_length = 5
-        elif command == "G":
-            _LOGGER.warning("Instant status not supported")
-            response = "000000000000000000000000000000000000000000000000\r"
-            command_length = 2
-        elif command == "H":
-            _LOGGER.warning("Instant status not supported")
-            response = "00000000000000000000000000000000000000 0000000000000000000000000000000000000000000000000000000000\r"
-            command_length = 2
-        elif command == "I":
-            mcp.set_switch(number, True)
-            command_length = 5
-        elif command == "J":
-            mcp.set_switch(number, False)
-            command_length = 5
-        elif command == "K":
-            response = f"{mcp.get_switch_name(number)}\r"
-            command_length = 5
-        elif command == "L":
-            response = f"{mcp.get_load_name(number)}\r"
-            command_length = 5
-        elif command == "M":
-            response = f"{mcp.get_scene_name(number)}\r"
-            command_length = 5
-        else:
-            _LOGGER.warning(f"Unknown command '{command}'")
-            command_length = 2
+            command -= 0x20
+        entry = MockMCP._COMMANDS.get(command)
+        if entry is None:
+            _LOGGER.warning("Unknown command %r", chr(command))
+            return 2, None
+        command_length, handler = entry
+        try:
+            response = handler(mcp, data, start)
+        except (ValueError, IndexError) as exc:
+            # Malformed or truncated number fields.
+            _LOGGER.warning("Bad command %r: %s", data[start : start + command_length], exc)
+            return command_length, None
         if response:
-            response = response.encode("utf-8")
-            _LOGGER.info(f"from MCP: {response}")
+            _LOGGER.info("from MCP: %s", response)
         return command_length, response
@@ -8,34 +8,50 @@ _LOGGER = logging.getLogger(__name__)
 
 async def handle_client(reader, writer):
     _LOGGER.info("Client connected")
-    loop = asyncio.get_running_loop()
+    drain_tasks = set()
 
-    async def async_write(data):
-        writer.write(data)
-        await writer.drain()
-
-    def handle_broadcast(data):
-        asyncio.run_coroutine_threadsafe(async_write(data), loop)
+    def drain_done(task):
+        drain_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
 
-    mcp.add_listener(handle_broadcast)
+    # Broadcasts come from handling requests on this same loop, so they
+    # can go straight into the writer's buffer. A client that only listens
+    # never reaches the drain after a request, so drain it in the background.
+    def broadcast(data: bytes):
+        if writer.is_closing():
+            return
+        writer.write(data)
+        if not drain_tasks and writer.transport.get_write_buffer_size():
+            task = asyncio.create_task(writer.drain())
+            drain_tasks.add(task)
+            task.add_done_callback(drain_done)
 
-    while True:
-        try:
-            request = await reader.readuntil(separator=b"\n")
-        except asyncio.exceptions.IncompleteReadError:
-            break
-        while len(request) > 0:
-            length, response = mcp.handle_input(request)
-            if response:
-                await async_write(response)
-            request = request[length:]
-    writer.close()
-    _LOGGER.info("Client disconnected")
+    mcp.add_listener(broadcast)
+    try:
+        while True:
+            try:
+                request = await reader.readuntil(separator=b"\n")
+            except (asyncio.exceptions.IncompleteReadError, ConnectionError):
+                break
+            position = 0
+            while position < len(request):
+                length, response = mcp.handle_input(request, position)
+                if response:
+                    writer.write(response)
+                position += length
+            await writer.drain()
+    finally:
+        mcp.remove_listener(broadcast)
+        for task in drain_tasks:
+            task.cancel()
+        writer.close()
+        _LOGGER.info("Client disconnected")
 
 
 async def run_server():
     port = 9999
-    _LOGGER.info(f"Listening for connections on port {port}")
+    _LOGGER.info("Listening for connections on port %d", port)
     server = await asyncio.start_server(handle_client, port=port)
     async with server:
         await server.serve_forever()
@@ -2,13 +2,105 @@ import logging
 import serial
 import threading
 import asyncio
-import queue
-from typing import Optional, Dict
-from itertools import chain
+from collections import deque
+from typing import Optional, Dict, List
+from itertools import chain, count
+from bisect import bisect_left
 from enum import Enum
 
 _LOGGER = logging.getLogger(__name__)
 
+# The on/off state of each bit in a byte, least significant bit first.
+_BYTE_BITS = [tuple((value >> bit) & 1 != 0 for bit in range(8)) for value in range(256)]
+
+# Load levels as the MCP reports them, in responses and in dim events.
+_LEVELS = {f"{level:02d}": level for level in range(100)}
+_LEVEL_BYTES = {b"%02d" % level: level for level in range(100)}
+
+# The most queries to put on the wire before waiting for their responses.
+_BATCH_SIZE = 8
+
+# How long the line may stay quiet before the oldest unanswered query times out.
+_REPLY_TIMEOUT_SECONDS = 1
+
+# The most queued bytes to combine into a single serial write.
+_MAX_WRITE_SIZE = 256
+
+# Bounds on how long the reader waits before retrying a failed read.
+_MIN_RETRY_SECONDS = 0.1
+_MAX_RETRY_SECONDS = 5
+
+# Transition times in seconds for each rate code, by load type.
+_RELAY_RATE_SECONDS = (
+    0,
+    1,
+    2,
+    3,
+    4,
+    5,
+    6,
+    7,
+    9,
+    11,
+    13,
+    16,
+    19,
+    23,
+    28,
+    34,
+    41,
+    49,
+    60,
+    75,
+    90,
+    110,
+    140,
+    175,
+    210,
+    250,
+    300,
+    380,
+    450,
+    550,
+    675,
+    800,
+)
+_FAN_RATE_SECONDS = (0,)
+_LVRB_RATE_SECONDS = (
+    0,
+    0.25,
+    0.50,
+    0.75,
+    1.00,
+    1.50,
+    2.00,
+    2.50,
+    3,
+    4,
+    5,
+    6,
+    7,
+    8,
+    10,
+    12,
+    14,
+    16,
+    18,
+    20,
+    25,
+    30,
+    45,
+    60,
+    90,
+    120,
+    300,
+    600,
+    900,
+    1200,
+    1800,
+    2700,
+)
+
 class Model(Enum):
     UNKNOWN = 0
     LITEJET = 1
@@ -35,12 +127,17 @@ class AsyncSerialAdapter:
         self._loop = asyncio.get_running_loop()
         self._thread_lock = threading.Lock()
         self._serial = None
+        self._read_lock = threading.Lock()
+        self._read_buffer = bytearray()
+        self._tasks = set()
         self.connected_changed = None
 
     def _connected_changed(self, connected: bool, reason: str):
-        asyncio.run_coroutine_threadsafe(
-            self.connected_changed(connected, reason), self._loop
-        )
+        # Already on the loop via call_soon_threadsafe, so start the
+        # notification as a task rather than hopping threads a second time.
+        task = self._loop.create_task(self.connected_changed(connected, reason))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def _ensure_connection(self):
         with self._thread_lock:
@@ -69,15 +166,40 @@ class AsyncSerialAdapter:
             return serial_instance
 
     async def read(self) -> bytes:
+        # A burst of events usually leaves more complete lines buffered;
+        # hand those out without another trip through the executor.
+        line = self._next_line()
+        if line is not None:
+            return line
         return await self._loop.run_in_executor(None, self._read)
 
     def _read(self) -> bytes:
         serial_instance = self._ensure_connection()
         try:
-            return self._serial.read_until(expected=b"\r")
+            # Read whatever is already waiting in one call rather than letting
+            # read_until() fetch the line a byte at a time.
+            line = self._next_line()
+            while line is None:
+                data = serial_instance.read(serial_instance.in_waiting or 1)
+                with self._read_lock:
+                    self._read_buffer += data
+                line = self._next_line()
         except serial.SerialException as exc:
             self._close(f"due to exception: {exc}")
             raise LiteJetError() from exc
+        return line
+
+    def _next_line(self) -> Optional[bytes]:
+        with self._read_lock:
+            buffer = self._read_buffer
+            end = buffer.find(b"\r")
+            if end < 0:
+                return None
+            # Copy the line out through a view to avoid an intermediate bytearray.
+            with memoryview(buffer) as view:
+                line = bytes(view[: end + 1])
+            del buffer[: end + 1]
+            return line
 
     async def write(self, data: bytes):
         await self._loop.run_in_executor(None, self._write, data)
@@ -105,6 +227,8 @@ class AsyncSerialAdapter:
                 _LOGGER.info("Disconnecting %s", reason)
                 self._serial.close()
                 self._serial = None
+                with self._read_lock:
+                    self._read_buffer.clear()
                 self._loop.call_soon_threadsafe(self._connected_changed, False, reason)
 
     @property
@@ -127,87 +251,36 @@ class LiteJet:
     LAST_BUTTON_SWITCH = 96
     LAST_SWITCH = 138
     KEYPAD_COUNT = 16
-    RELAY_RATE_SECONDS = [
-        0,
-        1,
-        2,
-        3,
-        4,
-        5,
-        6,
-        7,
-        9,
-        11,
-        13,
-        16,
-        19,
-        23,
-        28,
-        34,
-        41,
-        49,
-        60,
-        75,
-        90,
-        110,
-        140,
-        175,
-        210,
-        250,
-        300,
-        380,
-        450,
-        550,
-        675,
-        800,
-    ]
-    FAN_RATE_SECONDS = [0]
-    LVRB_RATE_SECONDS = [
-        0,
-        0.25,
-        0.50,
-        0.75,
-        1.00,
-        1.50,
-        2.00,
-        2.50,
-        3,
-        4,
-        5,
-        6,
-        7,
-        8,
-        10,
-        12,
-        14,
-        16,
-        18,
-        20,
-        25,
-        30,
-        45,
-        60,
-        90,
-        120,
-        300,
-        600,
-        900,
-        1200,
-        1800,
-        2700,
-    ]
+    RELAY_RATE_SECONDS = _RELAY_RATE_SECONDS
+    FAN_RATE_SECONDS = _FAN_RATE_SECONDS
+    LVRB_RATE_SECONDS = _LVRB_RATE_SECONDS
 
     _serial: serial.Serial
     _adapter: AsyncSerialAdapter
     _reader_task: asyncio.Task
+    _writer_task: Optional[asyncio.Task] = None
     _start: str
 
     def __init__(self):
         self._events = {}
-        self._command_lock = asyncio.Lock()
-        self._recv_event = asyncio.Event()
-        self._recv_line = None
+        self._handler_events = {}
+        self._packets = {}
+        # [reply future, time written] for each query on the wire, oldest first.
+        self._pending = deque()
+        self._pending_freed = asyncio.Event()
+        self._reply_timer = None
+        self._last_response = 0
+        self._outbox = asyncio.Queue()
+        # Unsolicited lines by (length, first byte); anything else is a response.
+        self._line_handlers = {
+            (4, ord("P")): self._handle_event_line,
+            (4, ord("R")): self._handle_event_line,
+            (4, ord("F")): self._handle_event_line,
+            (4, ord("N")): self._handle_event_line,
+            (7, ord("^")): self._handle_dim_line,
+        }
         self._reader_active = False
+        self._reader_wake = asyncio.Event()
         self._open = False
         self.connected = False
         self.board_count = 1
@@ -224,6 +297,7 @@ class LiteJet:
         try:
             self._reader_active = True
             self._reader_task = asyncio.create_task(self._reader_impl())
+            self._writer_task = asyncio.create_task(self._writer_impl())
 
             # Auto detect which start symbol the MCP expects.
             self._start = "^"
@@ -242,12 +316,12 @@ class LiteJet:
             # Auto detect if this is a dual MCP.
             is_dual = False
             try:
-                await self._sendrecv(f"{self._start}g")
+                await self._sendrecv(self._command("g"))
 
                 # A single MCP can respond as both the "other" and "this"
                 # board so also check the first load's names are different.
-                my_name = await self._sendrecv(f"{self._start}L001")
-                other_name = await self._sendrecv(f"{self._start}l001")
+                my_name = await self._sendrecv(self._command("L", 1, LiteJet.LAST_LOAD))
+                other_name = await self._sendrecv(self._command("l", 1, LiteJet.LAST_LOAD))
                 is_dual = my_name != other_name
             except LiteJetTimeout:
                 pass
@@ -261,98 +335,285 @@ class LiteJet:
             self._open = True
             await self._connected_changed(True, None)
         except:
+            self._reader_active = False
             await self._adapter.close()
+            await self._stop_tasks()
             raise
 
     async def _reader_impl(self):
+        backoff = _MIN_RETRY_SECONDS
         while self._reader_active:
             try:
                 line = await self._adapter.read()
-            except:
-                await asyncio.sleep(5)
+            except Exception:
+                # Retry sooner after a brief glitch, and straight away once
+                # the connection is back.
+                self._reader_wake.clear()
+                try:
+                    await asyncio.wait_for(self._reader_wake.wait(), timeout=backoff)
+                except asyncio.exceptions.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, _MAX_RETRY_SECONDS)
                 continue
-
-            line = line[0:-1].decode("utf-8")
-
-            _LOGGER.debug(f'Read "{line}" ({len(line)})')
-            if len(line) == 4 and (line[0] == "P" or line[0] == "R"):
-                self._notify_event(line)
-            elif len(line) == 4 and (line[0] == "F" or line[0] == "N"):
-                self._notify_event(line)
-            elif len(line) == 7 and line[0] == "^" and line[1] == "K":
-                new_level = line[5:7]
-                _LOGGER.debug("Dim event: '" + line[2:5] + "' '" + new_level + "'")
-                event_name = "F" if new_level == "00" else "N"
-                self._notify_event(event_name + line[2:5], int(new_level))
-            else:
-                self._recv_line = line
-                self._recv_event.set()
+            backoff = _MIN_RETRY_SECONDS
+
+            # Classify the line on its raw bytes; only responses are decoded.
+            line = line[0:-1]
+            length = len(line)
+
+            _LOGGER.debug('Read "%s" (%d)', line, length)
+            handler = self._line_handlers.get(
+                (length, line[0] if length else None), self._handle_response_line
+            )
+            handler(line)
+
+    def _handle_event_line(self, line: bytes):
+        self._notify_event(line)
+
+    def _handle_dim_line(self, line: bytes):
+        if line[1] != ord("K"):
+            self._handle_response_line(line)
+            return
+        new_level = line[5:7]
+        _LOGGER.debug("Dim event: '%s' '%s'", line[2:5], new_level)
+        level = _LEVEL_BYTES.get(new_level)
+        if level is None:
+            level = int(new_level)
+        event_name = b"N" if level else b"F"
+        self._notify_event(event_name + line[2:5], level)
+
+    def _handle_response_line(self, line: bytes):
+        # Responses arrive in the order the queries were written. A query
+        # whose caller gave up still holds its place, so its response is
+        # read and thrown away here rather than handed to the next query.
+        if not self._pending:
+            _LOGGER.debug('Unexpected response "%s"', line)
+            return
+        reply, _ = self._pending.popleft()
+        self._last_response = asyncio.get_running_loop().time()
+        self._pending_freed.set()
+        self._arm_reply_timer()
+        if not reply.done():
+            reply.set_result(line.decode("latin-1"))
+
+    def _arm_reply_timer(self):
+        # The oldest query times out once the line has been quiet for long
+        # enough since it was written and since the last response.
+        if self._reply_timer is not None:
+            self._reply_timer.cancel()
+            self._reply_timer = None
+        if not self._pending:
+            return
+        written = self._pending[0][1]
+        if written is None:
+            # Still being written; armed again once the write returns.
+            return
+        deadline = max(written, self._last_response) + _REPLY_TIMEOUT_SECONDS
+        self._reply_timer = asyncio.get_running_loop().call_at(deadline, self._expire_reply)
+
+    def _expire_reply(self):
+        self._reply_timer = None
+        reply, _ = self._pending.popleft()
+        _LOGGER.debug("No response")
+        if not reply.done():
+            reply.set_exception(LiteJetTimeout())
+        self._pending_freed.set()
+        self._arm_reply_timer()
 
     async def close(self):
         self._open = False
         self._reader_active = False
         await self._adapter.close()
-        self._reader_task.cancel()
-
-    async def _send(self, command: str):
-        _LOGGER.debug('WantToSend "%s"', command)
-        async with self._command_lock:
-            _LOGGER.debug('Send "%s"', command)
-            await self._adapter.write(bytes(f"{command}\n", "utf-8"))
-
-    async def _sendrecv(self, command: str):
-        _LOGGER.debug('WantToSendRecv "%s"', command)
-        async with self._command_lock:
-            self._recv_event.clear()
-
-            _LOGGER.debug('SendRecv(S) "%s"', command)
-            await self._adapter.write(bytes(f"{command}\n", "utf-8"))
+        await self._stop_tasks()
+
+    async def _stop_tasks(self):
+        tasks = (self._reader_task, self._writer_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Nothing will answer or write these any more.
+        if self._reply_timer is not None:
+            self._reply_timer.cancel()
+            self._reply_timer = None
+        while self._pending:
+            reply, _ = self._pending.popleft()
+            if not reply.done():
+                reply.set_exception(LiteJetError("Connection closed"))
+        while not self._outbox.empty():
+            _, _, done = self._outbox.get_nowait()
+            if not done.done():
+                done.set_exception(LiteJetError("Connection closed"))
+
+    async def _writer_impl(self):
+        # Owns writing to the serial line. The reader matches responses to
+        # queries in order, so several queries can be on the wire at once.
+        item = None
+        try:
+            while True:
+                if item is None:
+                    item = await self._outbox.get()
+
+                # Wait for earlier queries to be answered before adding too many more.
+                while self._pending and len(self._pending) + item[1] > _BATCH_SIZE:
+                    self._pending_freed.clear()
+                    await self._pending_freed.wait()
+
+                items = [item]
+                size = len(item[0])
+                replies = len(self._pending) + item[1]
+                item = None
+
+                # Fold anything else already queued into the same write.
+                while size < _MAX_WRITE_SIZE and not self._outbox.empty():
+                    item = self._outbox.get_nowait()
+                    if replies + item[1] > _BATCH_SIZE:
+                        break
+                    items.append(item)
+                    size += len(item[0])
+                    replies += item[1]
+                    item = None
+
+                # Register the replies before writing; a response can be read
+                # before the write returns.
+                loop = asyncio.get_running_loop()
+                reply_lists = []
+                slots = []
+                for _, reply_count, _ in items:
+                    reply_list = tuple(loop.create_future() for _ in range(reply_count))
+                    slots += ([reply, None] for reply in reply_list)
+                    reply_lists.append(reply_list)
+                self._pending.extend(slots)
+
+                data = b"".join(data for data, _, _ in items)
+                _LOGGER.debug('Write "%s"', data)
+                try:
+                    await self._adapter.write(data)
+                except Exception as exc:
+                    self._fail_items(items, reply_lists, exc)
+                    continue
+                except asyncio.CancelledError:
+                    self._fail_items(items, reply_lists, LiteJetError("Connection closed"))
+                    raise
+
+                # The queries are on the wire: start their timeouts. Replies
+                # given up on from here keep their slot until answered or expired.
+                written = loop.time()
+                for slot in slots:
+                    slot[1] = written
+                if slots:
+                    self._arm_reply_timer()
+
+                for (_, _, done), reply_list in zip(items, reply_lists):
+                    if done.done():
+                        for reply in reply_list:
+                            reply.cancel()
+                    else:
+                        done.set_result(reply_list)
+        except asyncio.CancelledError:
+            # An item taken off the outbox but not yet written is held here
+            # and nowhere else, so fail it before stopping.
+            if item is not None and not item[2].done():
+                item[2].set_exception(LiteJetError("Connection closed"))
+            raise
 
-            _LOGGER.debug("SendRecv(W)")
-            try:
-                await asyncio.wait_for(self._recv_event.wait(), timeout=1)
-            except asyncio.exceptions.TimeoutError as exc:
-                raise LiteJetTimeout() from exc
+    def _fail_items(self, items, reply_lists, exc: Exception):
+        # These queries never made it onto the wire, so nothing will answer
+        # them and their slots can go.
+        failed = set()
+        for (_, _, done), reply_list in zip(items, reply_lists):
+            for reply in reply_list:
+                reply.cancel()
+            failed.update(reply_list)
+            if not done.done():
+                done.set_exception(exc)
+        if failed:
+            self._pending = deque(slot for slot in self._pending if slot[0] not in failed)
+            self._pending_freed.set()
+            self._arm_reply_timer()
+
+    async def _recv(self, replies):
+        # The reader and its reply timer resolve these; the query keeps its
+        # place in line even if this caller stops waiting.
+        try:
+            results = [await reply for reply in replies]
+        finally:
+            for reply in replies:
+                reply.cancel()
+        for result in results:
+            _LOGGER.debug('Response "%s"', result)
+        return results
+
+    async def _submit(self, data: bytes, replies: int):
+        if self._writer_task is None or self._writer_task.done():
+            raise LiteJetError("Connection closed")
+        done = asyncio.get_running_loop().create_future()
+        self._outbox.put_nowait((data, replies, done))
+        return await self._recv(await done)
+
+    async def _send(self, packet: bytes):
+        _LOGGER.debug('Send "%s"', packet)
+        await self._submit(packet, 0)
+
+    async def _sendrecv(self, packet: bytes):
+        _LOGGER.debug('SendRecv "%s"', packet)
+        (result,) = await self._submit(packet, 1)
+        return result
 
-            result = self._recv_line
-            _LOGGER.debug('SendRecv(R) "%s"', result)
-            return result
+    async def _sendrecv_many(self, packets: List[bytes]):
+        # Responses arrive in the order the commands were sent, so a batch of
+        # commands can be written together instead of one round trip each.
+        results = []
+        for start in range(0, len(packets), _BATCH_SIZE):
+            batch = packets[start : start + _BATCH_SIZE]
+            _LOGGER.debug('SendRecvMany "%s"', batch)
+            results += await self._submit(b"".join(batch), len(batch))
+        return results
 
     def _add_event(self, event_name, handler):
-        event_list = self._events.get(event_name, None)
-        if event_list is None:
-            event_list = []
-            self._events[event_name] = event_list
-        event_list.append(handler)
+        # Handlers are kept as dict keys: called in the order they were
+        # added, like a list, but removable without a scan.
+        handlers = self._events.get(event_name, None)
+        if handlers is None:
+            handlers = {}
+            self._events[event_name] = handlers
+        handlers[handler] = None
+        self._handler_events.setdefault(handler, []).append(handlers)
 
     def _notify_event(self, event_name, *args):
         _LOGGER.debug('Event "%s"', event_name)
-        event_list = self._events.get(event_name, None)
-        if event_list is not None:
-            for handler in event_list:
+        handlers = self._events.get(event_name, None)
+        if handlers is not None:
+            # Copy so handlers can unsubscribe while being notified.
+            for handler in tuple(handlers):
                 handler(*args)
 
     def unsubscribe(self, handler):
-        for event_name, event_list in self._events.items():
-            event_list[:] = [x for x in event_list if x != handler]
+        # Only visit the events this handler was added to.
+        for handlers in self._handler_events.pop(handler, ()):
+            handlers.pop(handler, None)
 
     def _hex2bits(self, response: str, input_first: int, input_last: int, output_first: int, output: Dict[int, bool]):
-        output_number = output_first
-        for digit in range(input_first, input_last, 2):
-            digit_value = int(response[digit : digit + 2], 16)
-            for bit in range(0, 8):
-                bit_value = (digit_value & (1 << bit)) != 0
-                output[output_number] = bit_value
-                output_number += 1
+        digits = range(input_first, input_last, 2)
+        try:
+            values = bytes.fromhex(response[input_first : input_first + 2 * len(digits)])
+        except ValueError:
+            values = b""
+        if len(values) != len(digits):
+            # Not a clean run of hex pairs (short, odd length or padded with
+            # spaces), so parse pair by pair as leniently as int() allows.
+            values = [int(response[digit : digit + 2], 16) for digit in digits]
+        byte_bits = map(_BYTE_BITS.__getitem__, values)
+        output.update(zip(count(output_first), chain.from_iterable(byte_bits)))
         return output
 
     def _seconds2rate(self, seconds, table):
-        for candidate_rate, candidate_seconds in enumerate(table):
-            if seconds <= candidate_seconds:
-                return candidate_rate
-        return len(table) - 1
+        # Tables are sorted, so the first rate at least as long is a bisect.
+        return min(bisect_left(table, seconds), len(table) - 1)
 
     async def _connected_changed(self, connected: bool, reason: str):
+        if connected:
+            self._reader_wake.set()
         if not self._open:
             connected = False
         if connected:
@@ -364,32 +625,42 @@ class LiteJet:
                 await self._adapter.close(reason)
         if connected != self.connected:
             self.connected = connected
-            self._notify_event("CONN", connected, reason)
+            self._notify_event(b"CONN", connected, reason)
 
     def on_connected_changed(self, handler):
-        self._add_event("CONN", handler)
+        self._add_event(b"CONN", handler)
 
     def on_load_activated(self, index: int, handler):
-        self._add_event(f"N{index:03d}", handler)
+        self._add_event(b"N%03d" % index, handler)
 
     def on_load_deactivated(self, index: int, handler):
-        self._add_event(f"F{index:03d}", handler)
+        self._add_event(b"F%03d" % index, handler)
 
     def on_switch_pressed(self, index: int, handler):
-        self._add_event(f"P{index:03d}", handler)
+        self._add_event(b"P%03d" % index, handler)
 
     def on_switch_released(self, index: int, handler):
-        self._add_event(f"R{index:03d}", handler)
+        self._add_event(b"R%03d" % index, handler)
+
+    def _command(self, command: str, index: Optional[int] = None, last_index: Optional[int] = None) -> bytes:
+        # Commands only ever take a small, fixed range of indexes so the
+        # encoded packet is built once and reused on later calls.
+        key = (self._start, command, index)
+        packet = self._packets.get(key)
+        if packet is not None:
+            return packet
 
-    def _command(self, command: str, index: Optional[int] = None, last_index: Optional[int] = None):
         # If index exceeds this MCP's range, send it to the other MCP.
         if index is not None and index > last_index:
             command = command.lower()
             index -= last_index
 
         if index is None:
-            return f"{self._start}{command}"
-        return f"{self._start}{command}{index:03d}"
+            text = f"{self._start}{command}\n"
+        else:
+            text = f"{self._start}{command}{index:03d}\n"
+        packet = self._packets[key] = text.encode("ascii")
+        return packet
 
     async def activate_load(self, index: int):
         await self._send(self._command("A", index, LiteJet.LAST_LOAD))
@@ -404,38 +675,37 @@ class LiteJet:
         await self._send(self._command("D", index, LiteJet.LAST_SCENE))
 
     async def activate_load_at(self, index: int, level: int, rate_seconds: int):
-        if index >= LiteJet.FIRST_LOAD_RELAY and index <= LiteJet.LAST_LOAD_RELAY:
-            table = LiteJet.RELAY_RATE_SECONDS
-        elif index >= LiteJet.FIRST_LOAD_LVRB and index <= LiteJet.LAST_LOAD_LVRB:
-            table = LiteJet.LVRB_RATE_SECONDS
+        if LiteJet.FIRST_LOAD <= index < len(_LOAD_RATE_SECONDS):
+            table = _LOAD_RATE_SECONDS[index]
         else:
-            table = LiteJet.FAN_RATE_SECONDS
+            table = _FAN_RATE_SECONDS
         rate = self._seconds2rate(rate_seconds, table)
         command = self._command("E", index, LiteJet.LAST_LOAD)
-        await self._send(f"{command}{level:02d}{rate:02d}")
+        await self._send(command[:-1] + b"%02d%02d\n" % (level, rate))
 
     async def get_load_level(self, index: int) -> int:
-        return int(await self._sendrecv(self._command("F", index, LiteJet.LAST_LOAD)))
+        response = await self._sendrecv(self._command("F", index, LiteJet.LAST_LOAD))
+        level = _LEVELS.get(response)
+        if level is None:
+            level = int(response)
+        return level
 
     # ^G: Get instant on/off status of all loads on this board
     # ^H: Get instant on/off status of all switches on this board.
 
     async def get_all_load_states(self):
+        # Query every board in one batch rather than one round trip each.
         bits = {}
-        response = await self._sendrecv(self._command("G"))
-        self._hex2bits(response, 0, 11, LiteJet.FIRST_LOAD, bits)
-        if self.board_count > 1:
-            response = await self._sendrecv(self._command("g"))
-            self._hex2bits(response, 0, 11, LiteJet.LAST_LOAD + 1, bits)
+        responses = await self._sendrecv_many([self._command("G"), self._command("g")][: self.board_count])
+        for board, response in enumerate(responses):
+            self._hex2bits(response, 0, 11, LiteJet.FIRST_LOAD + board * LiteJet.LAST_LOAD, bits)
         return bits
 
     async def get_all_switch_states(self):
         bits = {}
-        response = await self._sendrecv(self._command("H"))
-        self._hex2bits(response, 0, 39, LiteJet.FIRST_SWITCH, bits)
-        if self.board_count > 1:
-            response = await self._sendrecv(self._command("h"))
-            self._hex2bits(response, 0, 39, LiteJet.LAST_SWITCH + 1, bits)
+        responses = await self._sendrecv_many([self._command("H"), self._command("h")][: self.board_count])
+        for board, response in enumerate(responses):
+            self._hex2bits(response, 0, 39, LiteJet.FIRST_SWITCH + board * LiteJet.LAST_SWITCH, bits)
         return bits
 
     async def press_switch(self, index: int):
@@ -453,6 +723,30 @@ class LiteJet:
     async def get_scene_name(self, index: int):
         return (await self._sendrecv(self._command("M", index, LiteJet.LAST_SCENE))).strip()
 
+    async def _get_names(self, command: str, indexes, last_index: int):
+        indexes = list(indexes)
+        responses = await self._sendrecv_many(
+            [self._command(command, index, last_index) for index in indexes]
+        )
+        return {index: response.strip() for index, response in zip(indexes, responses)}
+
+    # Pass indexes to fetch only some of the names in one batch.
+
+    async def get_all_switch_names(self, indexes=None):
+        if indexes is None:
+            indexes = self.all_switches()
+        return await self._get_names("K", indexes, LiteJet.LAST_SWITCH)
+
+    async def get_all_load_names(self, indexes=None):
+        if indexes is None:
+            indexes = self.loads()
+        return await self._get_names("L", indexes, LiteJet.LAST_LOAD)
+
+    async def get_all_scene_names(self, indexes=None):
+        if indexes is None:
+            indexes = self.scenes()
+        return await self._get_names("M", indexes, LiteJet.LAST_SCENE)
+
     def loads(self):
         return range(LiteJet.FIRST_LOAD, LiteJet.LAST_LOAD * self.board_count + 1)
 
@@ -469,16 +763,9 @@ class LiteJet:
         return range(LiteJet.FIRST_SCENE, LiteJet.LAST_SCENE + 1)
 
     def get_switch_keypad_number(self, index: int):
-        for board in range(0, self.board_count):
-            if index < LiteJet.FIRST_SWITCH:
-                return None
-            if index <= LiteJet.LAST_BUTTON_SWITCH:
-                # Keypad #1 has switches 1-6, #2 has 7-12, ...
-                return (board * LiteJet.KEYPAD_COUNT) + (int((index - 1) / 6) + 1)
-            if index <= LiteJet.LAST_SWITCH:
-                # Touch Panel Programmer
-                return 0
-            index -= LiteJet.LAST_SWITCH
+        if LiteJet.FIRST_SWITCH <= index <= LiteJet.LAST_SWITCH * self.board_count:
+            return _KEYPAD_NUMBERS[index]
+        return None
 
     def get_switch_keypad_name(self, index: int):
         keypad_number = self.get_switch_keypad_number(index)
@@ -486,6 +773,28 @@ class LiteJet:
             return "Touch Panel Programmer"
         return f"Keypad #{keypad_number}"
 
+# Keypad number by switch index, across both boards of a LiteJet 48.
+# Keypad #1 has switches 1-6, #2 has 7-12, ... and 0 is the Touch Panel
+# Programmer.
+_KEYPAD_NUMBERS = [None] + [
+    board * LiteJet.KEYPAD_COUNT + (switch - 1) // 6 + 1
+    if switch <= LiteJet.LAST_BUTTON_SWITCH
+    else 0
+    for board in range(2)
+    for switch in range(LiteJet.FIRST_SWITCH, LiteJet.LAST_SWITCH + 1)
+]
+
+# Rate table by load index, across both boards of a LiteJet 48.
+_LOAD_RATE_SECONDS = [None] + [
+    _RELAY_RATE_SECONDS
+    if LiteJet.FIRST_LOAD_RELAY <= load <= LiteJet.LAST_LOAD_RELAY
+    else _LVRB_RATE_SECONDS
+    if LiteJet.FIRST_LOAD_LVRB <= load <= LiteJet.LAST_LOAD_LVRB
+    else _FAN_RATE_SECONDS
+    for board in range(2)
+    for load in range(LiteJet.FIRST_LOAD, LiteJet.LAST_LOAD + 1)
+]
+
 async def open(url):
     lj = LiteJet()
     await lj.open(url)
@@ -2,9 +2,18 @@
 import sys
 import logging
 import argparse
-import serial
 import asyncio
-import pylitejet
+from functools import partial
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pylitejet
+
+# How each load level reads in the output.
+LEVEL_STRINGS = tuple(
+    "off" if level == 0 else "on" if level == 99 else f"at {level}%"
+    for level in range(100)
+)
 
 
 async def cmd_none(args):
@@ -21,54 +30,67 @@ async def cmd_info(lj, args):
 
 # Command: list
 async def cmd_list(lj, args):
+    # Collect the rows and write them out in one go.
+    lines = []
     if args.loads:
         load_states = await lj.get_all_load_states()
-        for number in lj.loads():
-            level = await lj.get_load_level(number) if load_states[number] else 0
-            if args.hide_off and level == 0:
-                continue
-            name = await lj.get_load_name(number)
-            if level == 0:
-                level_string = "off"
-            elif level == 99:
-                level_string = "on"
-            else:
-                level_string = "at " + str(level) + "%"
-            print('Load {} is named "{}" and is {}'.format(number, name, level_string))
+        # Query the levels of every load that is on together.
+        on_loads = [number for number in lj.loads() if load_states[number]]
+        on_levels = await asyncio.gather(*(lj.get_load_level(number) for number in on_loads))
+        load_levels = dict(zip(on_loads, on_levels))
+        # Only fetch the names of the rows that will be printed.
+        numbers = [
+            number
+            for number in lj.loads()
+            if not args.hide_off or load_levels.get(number, 0) != 0
+        ]
+        load_names = await lj.get_all_load_names(numbers)
+        for number in numbers:
+            name = load_names[number]
+            level_string = LEVEL_STRINGS[load_levels.get(number, 0)]
+            lines.append('Load {} is named "{}" and is {}'.format(number, name, level_string))
     if args.scenes:
+        scene_names = await lj.get_all_scene_names()
         for number in lj.scenes():
-            name = await lj.get_scene_name(number)
-            print('Scene {} is named "{}"'.format(number, name))
-    if args.buttons:
+            name = scene_names[number]
+            lines.append('Scene {} is named "{}"'.format(number, name))
+    if args.buttons or args.all_switches:
         switch_states = await lj.get_all_switch_states()
-        for number in lj.button_switches():
-            if args.hide_off and not switch_states[number]:
-                continue
-            name = await lj.get_switch_name(number)
+        buttons = []
+        if args.buttons:
+            buttons = [
+                number
+                for number in lj.button_switches()
+                if not args.hide_off or switch_states[number]
+            ]
+        switches = []
+        if args.all_switches:
+            switches = [
+                number
+                for number in lj.all_switches()
+                if not args.hide_off or switch_states[number]
+            ]
+        # Buttons are also in all switches, so ask for each name once.
+        switch_names = await lj.get_all_switch_names(dict.fromkeys(buttons + switches))
+        for number in buttons:
+            name = switch_names[number]
             is_pressed = " and is pressed" if switch_states[number] else ""
             keypad_name = lj.get_switch_keypad_name(number)
-            print('Switch {} is named "{}" ({}){}'.format(number, name, keypad_name, is_pressed))
-    if args.all_switches:
-        switch_states = await lj.get_all_switch_states()
-        for number in lj.all_switches():
-            if args.hide_off and not switch_states[number]:
-                continue
-            name = await lj.get_switch_name(number)
+            lines.append('Switch {} is named "{}" ({}){}'.format(number, name, keypad_name, is_pressed))
+        for number in switches:
+            name = switch_names[number]
             is_pressed = " and is pressed" if switch_states[number] else ""
             keypad_name = lj.get_switch_keypad_name(number)
-            print('(All) Switch {} is named "{}" ({}){}'.format(number, name, keypad_name, is_pressed))
+            lines.append('(All) Switch {} is named "{}" ({}){}'.format(number, name, keypad_name, is_pressed))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Command: load
 async def cmd_load(lj, args):
     name = await lj.get_load_name(args.number)
     level = await lj.get_load_level(args.number)
-    if level == 0:
-        level_string = "off"
-    elif level == 99:
-        level_string = "on"
-    else:
-        level_string = "at " + str(level) + "%"
+    level_string = LEVEL_STRINGS[level]
     print(f'Load {args.number} is named "{name}" and is {level_string}')
 
 
@@ -120,10 +142,7 @@ async def cmd_switch_release(lj, args):
 
 
 # Command: monitor
-async def cmd_monitor(lj: pylitejet.LiteJet, args):
-    def capture(func, name, number):
-        return lambda *args: func(name, number, *args)
-
+async def cmd_monitor(lj: "pylitejet.LiteJet", args):
     def load_activated(name, number, level):
         print("Load {} ({}) activated to {}%.".format(name, number, level or "??"))
 
@@ -141,100 +160,133 @@ async def cmd_monitor(lj: pylitejet.LiteJet, args):
 
     lj.on_connected_changed(connected_changed)
 
+    load_names = await lj.get_all_load_names()
     for number in lj.loads():
-        name = await lj.get_load_name(number)
-        lj.on_load_activated(number, capture(load_activated, name, number))
-        lj.on_load_deactivated(number, capture(load_deactivated, name, number))
+        name = load_names[number]
+        lj.on_load_activated(number, partial(load_activated, name, number))
+        lj.on_load_deactivated(number, partial(load_deactivated, name, number))
+    switch_names = await lj.get_all_switch_names()
     for number in lj.all_switches():
-        name = await lj.get_switch_name(number)
-        lj.on_switch_pressed(number, capture(switch_pressed, name, number))
-        lj.on_switch_released(number, capture(switch_released, name, number))
-
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, input, "Press any key to stop monitoring...")
+        name = switch_names[number]
+        lj.on_switch_pressed(number, partial(switch_pressed, name, number))
+        lj.on_switch_released(number, partial(switch_released, name, number))
+
+    # Wait on stdin from the loop itself rather than parking an executor
+    # thread in input(), falling back to that where stdin can't be watched.
+    loop = asyncio.get_running_loop()
+    prompt = "Press any key to stop monitoring..."
+    stop = asyncio.Event()
+    try:
+        loop.add_reader(sys.stdin.fileno(), stop.set)
+    except (NotImplementedError, OSError):
+        await loop.run_in_executor(None, input, prompt)
+        return
+    print(prompt, end="", flush=True)
+    try:
+        await stop.wait()
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+    sys.stdin.readline()
 
 
 # Main
 
 
-async def main():
-    parser = argparse.ArgumentParser("Control a LiteJet lighting system.")
-    parser.set_defaults(func=None)
-    parser.add_argument("--path", required=True)
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        help="Show debug logging, including data sent and received via serial port.",
-        action="store_const",
-        const=logging.DEBUG,
-        default=logging.WARN,
-    )
-    subparsers = parser.add_subparsers()
-
-    parser_info = subparsers.add_parser("info", help="Information about the board.")
-    parser_info.set_defaults(func=cmd_info)
-
-    parser_list = subparsers.add_parser("list", help="List available items.")
+def build_list(parser_list):
     parser_list.add_argument("-l", "--loads", action="store_true")
     parser_list.add_argument("-s", "--scenes", action="store_true")
     parser_list.add_argument("-b", "--buttons", action="store_true")
     parser_list.add_argument("--all_switches", action="store_true")
     parser_list.add_argument("--hide_off", action="store_true")
-    parser_list.set_defaults(func=cmd_list)
 
-    parser_load = subparsers.add_parser("load", help="Change load level.")
+
+def build_load(parser_load):
     parser_load.add_argument("number", type=int)
-    subparser_load = parser_load.add_subparsers()
+    subparser_load = parser_load.add_subparsers(dest="action")
     parser_load_set = subparser_load.add_parser(
         "set", help="Set load to a specific level."
     )
     parser_load_set.add_argument("level", type=int)
     parser_load_set.add_argument("rate", type=int, default=0)
-    parser_load_set.set_defaults(func=cmd_load_set)
-    parser_load_on = subparser_load.add_parser(
-        "on", help="Set load to its default level."
-    )
-    parser_load_on.set_defaults(func=cmd_load_on)
-    parser_load_off = subparser_load.add_parser("off", help="Turn off a load.")
-    parser_load_off.set_defaults(func=cmd_load_off)
-    parser_load_get = subparser_load.add_parser("get", help="Get load information.")
-    parser_load_get.set_defaults(func=cmd_load)
+    subparser_load.add_parser("on", help="Set load to its default level.")
+    subparser_load.add_parser("off", help="Turn off a load.")
+    subparser_load.add_parser("get", help="Get load information.")
+
 
-    parser_scene = subparsers.add_parser("scene", help="Change scene activation.")
+def build_scene(parser_scene):
     parser_scene.add_argument("number", type=int)
-    subparser_scene = parser_scene.add_subparsers()
-    parser_scene_on = subparser_scene.add_parser("on", help="Turn on a scene.")
-    parser_scene_on.set_defaults(func=cmd_scene_on)
-    parser_scene_off = subparser_scene.add_parser("off", help="Turn off a scene.")
-    parser_scene_off.set_defaults(func=cmd_scene_off)
-    parser_scene_get = subparser_scene.add_parser("get", help="Get scene information.")
-    parser_scene_get.set_defaults(func=cmd_scene)
-
-    parser_switch = subparsers.add_parser("switch", help="Change switch activation.")
+    subparser_scene = parser_scene.add_subparsers(dest="action")
+    subparser_scene.add_parser("on", help="Turn on a scene.")
+    subparser_scene.add_parser("off", help="Turn off a scene.")
+    subparser_scene.add_parser("get", help="Get scene information.")
+
+
+def build_switch(parser_switch):
     parser_switch.add_argument("number", type=int)
-    subparser_switch = parser_switch.add_subparsers()
-    parser_switch_on = subparser_switch.add_parser(
-        "press", help="Simulate pressing a switch."
-    )
-    parser_switch_on.set_defaults(func=cmd_switch_press)
-    parser_switch_off = subparser_switch.add_parser(
-        "release", help="Simulate releasing a switch."
-    )
-    parser_switch_off.set_defaults(func=cmd_switch_release)
-    parser_switch_get = subparser_switch.add_parser(
-        "get", help="Get switch information."
-    )
-    parser_switch_get.set_defaults(func=cmd_switch)
+    subparser_switch = parser_switch.add_subparsers(dest="action")
+    subparser_switch.add_parser("press", help="Simulate pressing a switch.")
+    subparser_switch.add_parser("release", help="Simulate releasing a switch.")
+    subparser_switch.add_parser("get", help="Get switch information.")
+
+
+COMMANDS = {
+    "info": ("Information about the board.", None),
+    "list": ("List available items.", build_list),
+    "load": ("Change load level.", build_load),
+    "scene": ("Change scene activation.", build_scene),
+    "switch": ("Change switch activation.", build_switch),
+    "monitor": ("Monitor items for state changes.", None),
+}
+
+# (command, action) -> handler
+DISPATCH = {
+    ("info", None): cmd_info,
+    ("list", None): cmd_list,
+    ("load", "set"): cmd_load_set,
+    ("load", "on"): cmd_load_on,
+    ("load", "off"): cmd_load_off,
+    ("load", "get"): cmd_load,
+    ("scene", "on"): cmd_scene_on,
+    ("scene", "off"): cmd_scene_off,
+    ("scene", "get"): cmd_scene,
+    ("switch", "press"): cmd_switch_press,
+    ("switch", "release"): cmd_switch_release,
+    ("switch", "get"): cmd_switch,
+    ("monitor", None): cmd_monitor,
+}
+
 
-    parser_monitor = subparsers.add_parser(
-        "monitor", help="Monitor items for state changes."
+async def main():
+    parser = argparse.ArgumentParser("Control a LiteJet lighting system.")
+    parser.add_argument("--path", required=True)
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        help="Show debug logging, including data sent and received via serial port.",
+        action="store_const",
+        const=logging.DEBUG,
+        default=logging.WARN,
     )
-    parser_monitor.set_defaults(func=cmd_monitor)
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Only fill in the arguments of commands that were actually given.
+    for name, (description, build) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=description)
+        if build is not None and name in sys.argv[1:]:
+            build(subparser)
 
     args = parser.parse_args()
+    func = DISPATCH.get((args.command, getattr(args, "action", None)))
+
+    if func is None:
+        await cmd_none(args)
+        return
 
     logging.basicConfig(level=args.verbose)
 
+    import serial
+    import pylitejet
+
     serial.protocol_handler_packages.append("test_handlers")
 
     try:
@@ -243,8 +295,7 @@ async def main():
         print(f"Cannot connect: {exc}")
         return
 
-    if args.func is not None:
-        await args.func(lj, args)
+    await func(lj, args)
 
     await lj.close()
 
@@ -5,52 +5,87 @@ from mock_mcp import MockMCP
 
 _LOGGER = logging.getLogger(__name__)
 
+# How many consumed bytes to let build up before dropping them.
+_COMPACT_SIZE = 4096
+
 
 class Serial(SerialBase):
     def open(self):
-        self._read_buffer = bytes()
-        self._read_ready = threading.Event()
-        self._read_ready.clear()
+        self._read_buffer = bytearray()
+        self._read_position = 0
+        self._read_cancelled = False
+        # Guards the buffer; readers wait on it for more data.
+        self._read_ready = threading.Condition()
         self._mcp = MockMCP()
         self._mcp.add_listener(self._respond)
         self.is_open = True
 
     def close(self):
-        self.is_open = False
+        with self._read_ready:
+            self.is_open = False
+            # Wake a blocked read so it can report the port closed.
+            self._read_ready.notify_all()
 
     def from_url(self, url):
         _LOGGER.error("url is %s", url)
 
     @property
     def in_waiting(self):
-        return len(self._read_buffer)
+        return len(self._read_buffer) - self._read_position
 
     @property
     def out_waiting(self):
         return 0
 
     def cancel_read(self):
-        self._read_buffer = bytes()
-        self._read_ready.set()
+        with self._read_ready:
+            self._read_buffer.clear()
+            self._read_position = 0
+            self._read_cancelled = True
+            self._read_ready.notify_all()
 
     def read(self, size=1):
-        self._read_ready.wait()
+        with self._read_ready:
+            self._read_cancelled = False
+            while (
+                self.is_open
+                and not self._read_cancelled
+                and self._read_position == len(self._read_buffer)
+            ):
+                self._read_ready.wait()
+            if not self.is_open:
+                raise PortNotOpenError()
 
-        next_bytes = self._read_buffer[0:size]
-        self._read_buffer = self._read_buffer[size:]
-        if len(self._read_buffer) == 0:
-            self._read_ready.clear()
-        return next_bytes
+            # Consume from a read position rather than re-slicing the buffer
+            # on every read. Appends happen under the same lock, so a drained
+            # buffer can simply be emptied; otherwise the consumed bytes are
+            # only dropped now and then.
+            buffer = self._read_buffer
+            position = self._read_position
+            next_bytes = bytes(buffer[position : position + size])
+            position += len(next_bytes)
+            if position == len(buffer):
+                buffer.clear()
+                position = 0
+            elif position >= _COMPACT_SIZE:
+                del buffer[:position]
+                position = 0
+            self._read_position = position
+            return next_bytes
 
     def _reconfigure_port(self):
         pass
 
     def write(self, data):
-        length, response = self._mcp.handle_input(data)
-        if response:
-            self._respond(response)
-        return length
+        position = 0
+        while position < len(data):
+            length, response = self._mcp.handle_input(data, position)
+            if response:
+                self._respond(response)
+            position += length
+        return len(data)
 
     def _respond(self, b: bytes):
-        self._read_buffer += b
-        self._read_ready.set()
+        with self._read_ready:
+            self._read_buffer += b
+            self._read_ready.notify()